@@ -9,6 +9,10 @@ HDR_FIRST_BREAK = 'FirstBreak'
 HDR_TRACE_POS = 'TRACE_POS_IN_SURVEY'
 
 
+# All fastmath flags supported by numba, kernels opt out of some of them by set difference
+ALL_FASTMATH_FLAGS = {'nnan', 'ninf', 'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
 # Default stacking velocity for spherical divergence correction and velocity spectrum calculation.
 # Estimated as the mean stacking velocity among variety of surveys.
 DEFAULT_STACKING_VELOCITY = StackingVelocity(
@@ -1,7 +1,6 @@
 """Implements Gather class that represents a group of seismic traces that share some common acquisition parameter"""
 
 import os
-import warnings
 from itertools import cycle
 from textwrap import dedent
 
@@ -1523,11 +1522,14 @@ class Gather(TraceContainer, SamplesContainer):
         alpha, lw = [np.clip(MAX_TRACE_DENSITY * (axes_width / self.n_traces), *val_bounds) if val is None else val
                      for val, val_bounds in zip([alpha, lw], BOUNDS)]
 
-        std_axis = 1 if norm_tracewise else None
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", category=RuntimeWarning)
-            traces = std * ((self.data - np.nanmean(self.data, axis=1, keepdims=True)) /
-                            (np.nanstd(self.data, axis=std_axis, keepdims=True) + 1e-10))
+        # Calculate nan-aware statistics without emitting warnings for traces consisting only of nan values
+        counts, means, variances = normalization.get_tracewise_nan_stats(self.data)
+        if not norm_tracewise:
+            _, global_var = normalization.merge_nan_stats(counts, means, variances)
+            variances = np.full_like(variances, global_var)
+        means = means.astype(self.data.dtype).reshape(-1, 1)
+        stds = np.sqrt(variances).astype(self.data.dtype).reshape(-1, 1)
+        traces = std * ((self.data - means) / (stds + 1e-10))
 
         # Shift trace amplitudes according to the trace index in the gather
         amps = traces + np.arange(traces.shape[0]).reshape(-1, 1)
@@ -1614,6 +1616,7 @@ class Gather(TraceContainer, SamplesContainer):
         colors_iterator = cycle(['tab:red', 'tab:blue', 'tab:orange', 'tab:green', 'tab:purple', 'tab:pink',
                                  'tab:olive', 'tab:cyan'])
         masks_list = self._parse_headers_kwargs(masks, "masks")
+        processed_masks_list = []
         for ix, (mask_dict, default_color) in enumerate(zip(masks_list, colors_iterator)):
             mask = mask_dict["masks"]
             if isinstance(mask, Gather):
@@ -1626,10 +1629,15 @@ class Gather(TraceContainer, SamplesContainer):
             if mask.ndim == 1:
                 mask = mask.reshape(-1, 1)
             threshold = mask_dict.pop("threshold", 0.5)
-            mask_dict["masks"] = np.broadcast_to(np.where(mask < threshold, np.nan, 1), self.shape)
+            # Skip empty masks before they are broadcasted to the gather shape
+            is_masked = ~(mask < threshold)
+            if not is_masked.any():
+                continue
+            mask_dict["masks"] = np.broadcast_to(np.where(is_masked, 1, np.nan), self.shape)
             mask_dict["label"] = mask_dict.get("label", f"Mask {ix+1}")
             mask_dict["color"] = mask_dict.get("color", default_color)
-        return [mask_dict for mask_dict in masks_list if not np.isnan(mask_dict["masks"]).all()]
+            processed_masks_list.append(mask_dict)
+        return processed_masks_list
 
     @staticmethod
     def _parse_headers_kwargs(headers_kwargs, headers_key):
@@ -7,7 +7,7 @@ import numpy as np
 from numba import njit, prange
 
 
-@njit(nogil=True, fastmath=True)
+@njit(nogil=True, fastmath=True, cache=True)
 def get_hodograph(gather_data, offsets, hodograph_times, sample_interval, interpolate=True, fill_value=np.nan,
                   max_offset=np.inf, out=None):
     """Retrieve hodograph amplitudes from the `gather_data`.
@@ -41,7 +41,10 @@ def get_hodograph(gather_data, offsets, hodograph_times, sample_interval, interp
     """
     if out is None:
         out = np.empty(len(hodograph_times), dtype=gather_data.dtype)
-    for i, hodograph_sample in enumerate(hodograph_times / sample_interval):
+    # Convert times to samples on the fly by multiplying by the reciprocal to avoid allocating a temporary array
+    inv_sample_interval = 1 / sample_interval
+    for i in range(len(hodograph_times)):  # pylint: disable=consider-using-enumerate
+        hodograph_sample = hodograph_times[i] * inv_sample_interval
         amplitude = fill_value
         if offsets[i] <= max_offset and hodograph_sample <= gather_data.shape[1] - 1:
             if interpolate:
@@ -55,17 +58,23 @@ def get_hodograph(gather_data, offsets, hodograph_times, sample_interval, interp
     return out
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def compute_hodograph_times(offsets, times, velocities):
     """Calculate times of hyperbolic hodographs for each start time, corresponding stacking velocity and all offsets.
     Offsets and times are 1d `np.ndarray`s. Velocities are either a 1d `np.ndarray` or a scalar.
     The result is a 2d `np.ndarray` with shape `(len(times), len(offsets))`."""
     # Explicit broadcasting velocities, in case it's scalar. Required for `parallel=True` flag
     velocities = np.ascontiguousarray(np.broadcast_to(velocities, times.shape))
-    return np.sqrt(times.reshape(-1, 1) ** 2 + (offsets / velocities.reshape(-1, 1)) ** 2)
+    # Evaluate the hyperbola in a single fused loop instead of materializing several temporary 2d arrays
+    hodograph_times = np.empty((len(times), len(offsets)), dtype=np.float64)
+    for i in prange(len(times)):
+        time_sq = times[i] ** 2
+        for j in range(len(offsets)):
+            hodograph_times[i, j] = np.sqrt(time_sq + (offsets[j] / velocities[i]) ** 2)
+    return hodograph_times
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def compute_crossover_offsets(hodograph_times, times, offsets):
     """Given `hodograph_times` for gather NMO correction, find an offset after which the crossover events occur for
     each timestamp.
@@ -106,7 +115,7 @@ def compute_crossover_offsets(hodograph_times, times, offsets):
 
     return np.interp(times, crossover_times, offsets)
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def apply_nmo(gather_data, times, offsets, stacking_velocities, sample_interval, mute_crossover=False,
               max_stretch_factor=np.inf, fill_value=np.nan):
     r"""Perform gather normal moveout correction with given stacking velocities for each timestamp.
@@ -148,9 +157,10 @@ def apply_nmo(gather_data, times, offsets, stacking_velocities, sample_interval,
     Returns
     -------
     corrected_gather_data : 2d array
-        NMO corrected gather data with an ordinary shape of (num_traces, trace_length).
+        NMO corrected gather data with shape (num_traces, len(times)).
     """
-    corrected_gather_data = np.full_like(gather_data, fill_value=fill_value)
+    # Each element of the output is set by `get_hodograph`, so only the columns for the requested times are allocated
+    corrected_gather_data = np.empty((gather_data.shape[0], times.shape[0]), dtype=gather_data.dtype)
     hodograph_times = compute_hodograph_times(offsets, times, stacking_velocities)
 
     max_offsets = times * stacking_velocities * np.sqrt((1 + max_stretch_factor) ** 2 - 1)
@@ -166,7 +176,7 @@ def apply_nmo(gather_data, times, offsets, stacking_velocities, sample_interval,
     return corrected_gather_data
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def apply_lmo(gather_data, trace_delays, fill_value):
     """Perform gather linear moveout correction with given delay for each trace.
 
@@ -3,7 +3,11 @@
 import numpy as np
 from numba import njit, prange
 
-@njit(nogil=True)
+from ...const import ALL_FASTMATH_FLAGS
+
+
+# Amplitudes may be nan, so the corresponding fastmath flag is disabled
+@njit(nogil=True, fastmath=ALL_FASTMATH_FLAGS - {'nnan'}, cache=True)
 def process_amp(amp, mode):
     """Process trace amplitude to use in AGC coefficient calculation."""
     if np.isnan(amp):
@@ -12,7 +16,7 @@ def process_amp(amp, mode):
     amp = amp**2 if mode=='rms' else abs(amp)
     return amp, non_zero
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, fastmath=ALL_FASTMATH_FLAGS - {'nnan'}, error_model='numpy', cache=True)
 def apply_agc(data, window_size=125, mode='rms'):
     """Calculate instantaneous or RMS amplitude AGC coefficients and apply them to gather data.
 
@@ -50,7 +54,8 @@ def apply_agc(data, window_size=125, mode='rms'):
         if mode == 'rms':
             coef = np.sqrt(coef)
         # Extrapolate first AGC coef for trace indices before start
-        data_res[i, : start + 1] = coef * data[i, : start + 1]
+        for j in range(start + 1):
+            data_res[i, j] = coef * data[i, j]
 
         # Move the window by one trace element and recalculate the AGC coef
         for j in range(start + 1, end):
@@ -67,11 +72,12 @@ def apply_agc(data, window_size=125, mode='rms'):
                 coef = np.sqrt(coef)
             data_res[i, j] = coef * data[i, j]
         # Extrapolate last AGC coef for trace indices after end
-        data_res[i, end:] = coef * data[i, end:]
+        for j in range(end, trace_len):
+            data_res[i, j] = coef * data[i, j]
 
     return data_res
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def calculate_sdc_coefficient(v_pow, velocities, t_pow, times):
     """Calculate spherical divergence correction coefficients."""
     sdc_coefficient = velocities**v_pow * times**t_pow
@@ -80,7 +86,7 @@ def calculate_sdc_coefficient(v_pow, velocities, t_pow, times):
     return sdc_coefficient
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def apply_sdc(data, v_pow, velocities, t_pow, times):
     """Calculate spherical divergence correction coefficients and apply them to gather data.
 
@@ -111,7 +117,7 @@ def apply_sdc(data, v_pow, velocities, t_pow, times):
         data[i] *= sdc_coefficient
     return data
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def undo_sdc(data, v_pow, velocities, t_pow, times):
     """Calculate spherical divergence correction coefficients and use them to undo previously applied SDC.
 
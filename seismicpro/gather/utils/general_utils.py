@@ -37,7 +37,7 @@ def convert_times_to_mask(times, samples):
     return (np.arange(len(samples)) - times_indices.reshape(-1, 1)) >= 0
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def convert_mask_to_pick(mask, samples, threshold):
     """Convert a first breaks `mask` into an array of arrival times.
 
@@ -81,19 +81,12 @@ def convert_mask_to_pick(mask, samples, threshold):
         trace = mask[i]
         max_len, curr_len, picking_ix = 0, 0, 0
         for j, sample in enumerate(trace):
-            # Count length of current sequence of ones
-            if sample >= threshold:
-                curr_len += 1
-            else:
-                # If the new longest sequence found
-                if curr_len > max_len:
-                    max_len = curr_len
-                    picking_ix = j
-                curr_len = 0
-        # If the longest sequence found in the end of the trace
-        if curr_len > max_len:
-            picking_ix = len(trace)
-            max_len = curr_len
+            # Count length of current sequence of ones without branching: the counter is reset by multiplication
+            curr_len = (curr_len + 1) * (sample >= threshold)
+            # Track the end of the longest sequence as soon as it becomes the longest one
+            if curr_len > max_len:
+                max_len = curr_len
+                picking_ix = j + 1
         picking_times[i] = samples[picking_ix - max_len]
     return picking_times
 
@@ -119,9 +112,13 @@ def mute_gather(gather_data, muting_times, samples, fill_value):
     gather_data : 2d np.ndarray
         Muted gather data.
     """
-    mask = convert_times_to_mask(times=muting_times, samples=samples)
-    data_shape = gather_data.shape
-    gather_data = gather_data.reshape(-1)
-    mask = mask.reshape(-1)
-    gather_data[~mask] = fill_value
-    return gather_data.reshape(data_shape)
+    # Fill each trace inplace up to its muting index instead of constructing a boolean mask of the gather shape
+    muting_indices = times_to_indices(muting_times, samples, round=True)
+    n_samples = gather_data.shape[1]
+    for i in range(len(gather_data)):  # pylint: disable=consider-using-enumerate
+        muting_ix = muting_indices[i]
+        # Traces with undefined muting time are muted entirely
+        n_muted = n_samples if np.isnan(muting_ix) else int(min(max(muting_ix, 0), n_samples))
+        for j in range(n_muted):
+            gather_data[i, j] = fill_value
+    return gather_data
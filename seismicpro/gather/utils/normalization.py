@@ -4,7 +4,7 @@ import numpy as np
 from numba import njit
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def clip_inplace(data, data_min, data_max):
     """Limit the `data` values. May change `data` inplace.
 
@@ -31,9 +31,94 @@ def clip_inplace(data, data_min, data_max):
     return data.reshape(data_shape)
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
+def get_tracewise_nan_stats(data):
+    """Calculate the number of non-nan values, their mean and variance for each trace of `data`.
+
+    Unlike `np.nanmean` and `np.nanstd` the function makes no temporary copies of `data` and does not emit warnings
+    for traces consisting only of nan values: both their mean and variance are set to nan.
+
+    Parameters
+    ----------
+    data : 2d np.ndarray
+        Data to calculate statistics for.
+
+    Returns
+    -------
+    counts : 1d np.ndarray
+        The number of non-nan values in each trace.
+    means : 1d np.ndarray
+        Mean value of each trace.
+    variances : 1d np.ndarray
+        Variance of each trace.
+    """
+    n_traces, trace_len = data.shape
+    counts = np.zeros(n_traces, dtype=np.int64)
+    means = np.full(n_traces, np.nan, dtype=np.float64)
+    variances = np.full(n_traces, np.nan, dtype=np.float64)
+    for i in range(n_traces):
+        count = 0
+        trace_sum = 0.0
+        for j in range(trace_len):
+            if not np.isnan(data[i, j]):
+                count += 1
+                trace_sum += data[i, j]
+        if count == 0:
+            continue
+        trace_mean = trace_sum / count
+
+        # Use the second pass over the trace to calculate variance in a numerically stable way
+        sq_dev_sum = 0.0
+        for j in range(trace_len):
+            if not np.isnan(data[i, j]):
+                sq_dev_sum += (data[i, j] - trace_mean)**2
+        counts[i] = count
+        means[i] = trace_mean
+        variances[i] = sq_dev_sum / count
+    return counts, means, variances
+
+
+@njit(nogil=True, cache=True)
+def merge_nan_stats(counts, means, variances):
+    """Merge tracewise statistics calculated by :func:`~get_tracewise_nan_stats` into mean and variance of the whole
+    data. Both are set to nan if the data contains no non-nan values.
+
+    Parameters
+    ----------
+    counts : 1d np.ndarray
+        The number of non-nan values in each trace.
+    means : 1d np.ndarray
+        Mean value of each trace.
+    variances : 1d np.ndarray
+        Variance of each trace.
+
+    Returns
+    -------
+    mean : float
+        Mean value of the whole data.
+    var : float
+        Variance of the whole data.
+    """
+    total_count = 0
+    total_sum = 0.0
+    for i in range(len(counts)):  # pylint: disable=consider-using-enumerate
+        if counts[i] > 0:
+            total_count += counts[i]
+            total_sum += counts[i] * means[i]
+    if total_count == 0:
+        return np.nan, np.nan
+    mean = total_sum / total_count
+
+    sq_dev_sum = 0.0
+    for i in range(len(counts)):  # pylint: disable=consider-using-enumerate
+        if counts[i] > 0:
+            sq_dev_sum += counts[i] * (variances[i] + (means[i] - mean)**2)
+    return mean, sq_dev_sum / total_count
+
+
+@njit(nogil=True, cache=True)
 def scale_standard(data, mean, std, eps):
-    r"""Scale `data` using the following formula:
+    r"""Scale `data` inplace using the following formula:
 
     :math:`S = \frac{data - mean}{std + eps}`
 
@@ -53,10 +138,12 @@ def scale_standard(data, mean, std, eps):
     data : np.ndarray
         Scaled data with unchanged shape.
     """
-    return (data - mean) / (std + eps)
+    data -= mean
+    data /= std + eps
+    return data
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def scale_maxabs(data, min_value, max_value, clip, eps):
     r"""Scale `data` inplace using the following formula:
 
@@ -92,7 +179,7 @@ def scale_maxabs(data, min_value, max_value, clip, eps):
     return data
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def scale_minmax(data, min_value, max_value, clip, eps):
     r"""Scale `data` inplace using the following formula:
 
@@ -15,6 +15,9 @@ class BaseMetricMap:  # pylint: disable=too-many-instance-attributes
 
     Should not be instantiated directly, use `MetricMap` or its subclasses instead.
     """
+    # Default aggregation function for each value of metric's `is_lower_better` to highlight outliers
+    default_agg = {True: "max", False: "min", None: "mean"}
+
     def __init__(self, coords, values, *, coords_cols=None, index=None, index_cols=None, metric=None, agg=None,
                  calculate_immediately=True):
         coords, coords_cols = parse_coords(coords, coords_cols)
@@ -29,8 +32,7 @@ class BaseMetricMap:  # pylint: disable=too-many-instance-attributes
             metric_data[index_cols] = index
 
         if agg is None:
-            default_agg = {True: "max", False: "min", None: "mean"}
-            agg = default_agg[metric.is_lower_better]
+            agg = self.default_agg[metric.is_lower_better]
 
         self._metric_data = None
         self._index_data = None
@@ -115,16 +117,19 @@ class BaseMetricMap:  # pylint: disable=too-many-instance-attributes
         """Preprocess and aggregate metric data into data to plot on the map. Automatically called upon the first
         access to map data if `append` or `extend` method was previously executed."""
         self._metric_data = pd.concat(self.metric_data_list, ignore_index=True, copy=False)
-        requires_explode = pd.api.types.is_object_dtype(self._metric_data[self.metric_name].dtype)
-        metric_agg = (lambda s: s.explode().agg(self.agg)) if requires_explode else self.agg
+        agg_data = self._metric_data
+        if pd.api.types.is_object_dtype(agg_data[self.metric_name].dtype):
+            # Explode the whole frame once instead of exploding values of each group separately during aggregation
+            agg_data = agg_data.explode(self.metric_name, ignore_index=True)
+            agg_data[self.metric_name] = agg_data[self.metric_name].infer_objects()
         agg_dict = {
             self.coords_cols[0]: (self.coords_cols[0], "min"),
             self.coords_cols[1]: (self.coords_cols[1], "min"),
             self.coords_cols[0] + "_max": (self.coords_cols[0], "max"),
             self.coords_cols[1] + "_max": (self.coords_cols[1], "max"),
-            self.metric_name: (self.metric_name, metric_agg),
+            self.metric_name: (self.metric_name, self.agg),
         }
-        index_data = self._metric_data.groupby(self.index_cols, as_index=False, sort=False).agg(**agg_dict)
+        index_data = agg_data.groupby(self.index_cols, as_index=False, sort=False).agg(**agg_dict)
         if ((index_data[self.coords_cols[0]] != index_data[self.coords_cols[0] + "_max"]).any() or
             (index_data[self.coords_cols[1]] != index_data[self.coords_cols[1] + "_max"]).any()):
             raise ValueError("Some map items have non-unique coordinates")
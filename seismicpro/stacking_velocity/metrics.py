@@ -22,7 +22,7 @@ default, it should also be appended to a `VELOCITY_QC_METRICS` list.
 
 import numpy as np
 from numba import njit
-from matplotlib import patches
+from matplotlib import patches, collections
 
 from ..metrics import Metric, ScatterMapPlot, MetricMap
 from ..utils import calculate_axis_limits, set_ticks, set_text_formatting
@@ -106,8 +106,18 @@ class StackingVelocityMetric(Metric):
     @staticmethod
     def plot(ax, window_velocities, times, **kwargs):
         """Plot all stacking velocities in a spatial window."""
-        for vel in np.atleast_2d(window_velocities):
-            ax.plot(vel, times, color="tab:blue", **kwargs)
+        # Add all velocities as a single collection instead of creating a separate line for each of them
+        window_velocities = np.atleast_2d(window_velocities)
+        segments = np.stack(np.broadcast_arrays(window_velocities, times), axis=-1)
+        try:
+            lines = collections.LineCollection(segments, color="tab:blue", **kwargs)
+        except AttributeError:
+            # Some kwargs are supported only by Line2D (e.g. markers), plot each velocity separately in this case
+            for vel in window_velocities:
+                ax.plot(vel, times, color="tab:blue", **kwargs)
+            return
+        ax.add_collection(lines)
+        ax.autoscale_view()
 
     def plot_on_click(self, ax, coords, index, x_ticker=None, y_ticker=None, **kwargs):
         """Plot all stacking velocities used by `calc` during metric calculation."""
@@ -197,9 +207,19 @@ class MaxStandardDeviation(StackingVelocityMetric):
         if window.shape[0] == 0:
             return 0
 
+        n_vel = window.shape[0]
         max_std = 0
         for i in range(window.shape[1]):
-            current_std = window[:, i].std()
+            # Explicit scalar reductions avoid generic strided array-method code paths for each window column
+            vel_sum = 0.0
+            for j in range(n_vel):
+                vel_sum += window[j, i]
+            vel_mean = vel_sum / n_vel
+
+            sq_dev_sum = 0.0
+            for j in range(n_vel):
+                sq_dev_sum += (window[j, i] - vel_mean)**2
+            current_std = np.sqrt(sq_dev_sum / n_vel)
             max_std = max(max_std, current_std)
         return max_std
 
@@ -224,7 +244,11 @@ class MaxRelativeVariation(StackingVelocityMetric):
 
         max_rel_var = 0
         for i in range(window.shape[1]):
-            current_rel_var = abs(np.mean(window[1:, i]) - window[0, i]) / window[0, i]
+            vel_sum = 0.0
+            for j in range(1, window.shape[0]):
+                vel_sum += window[j, i]
+            vel_mean = vel_sum / (window.shape[0] - 1)
+            current_rel_var = abs(vel_mean - window[0, i]) / window[0, i]
             max_rel_var = max(max_rel_var, current_rel_var)
         return max_rel_var
 
@@ -5,20 +5,20 @@ import networkx as nx
 from numba import njit
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def get_closest_index_by_val(val, array):
     """Return indices of the array elements, closest to the values from `val`."""
     return np.array([np.argmin(np.abs(v - array)) for v in val])
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def interpolate_indices(x0, y0, x1, y1, x):
     """Linearly interpolate an int-valued function between points (`x0`, `y0`) and (`x1`, `y1`) and calculate its
     values at `x`."""
     return (y1 * (x - x0) + y0 * (x1 - x)) // (x1 - x0)
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def create_edges(velocity_spectrum, times, velocities, start_velocity_range, end_velocity_range, max_vel_step,
                  n_times, n_velocities):
     """Return edges of the graph for stacking velocity computation with their weights.
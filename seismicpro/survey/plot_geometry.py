@@ -58,6 +58,10 @@ class SurveyGeometryPlot(PairedPlot):  # pylint: disable=too-many-instance-attri
         self.plot_gather = partial(self._plot_gather, **gather_plot_kwargs)
         self.activated_scatter = None
 
+        # The last loaded gather and its index in the current view, reused on redraws of the same gather
+        self.cached_index = None
+        self.cached_gather = None
+
         super().__init__(orientation=orientation)
 
     def construct_main_plot(self):
@@ -161,9 +165,14 @@ class SurveyGeometryPlot(PairedPlot):  # pylint: disable=too-many-instance-attri
     def _plot_gather(self, ax, coords, index, **kwargs):
         """Display a gather with given index and highlight locations of activated sources or receivers."""
         _ = coords
-        gather = self.survey.get_gather(index)
-        if self.sort_by is not None:
-            gather = gather.sort(by=self.sort_by)
+        cached_index = (self.is_shot_view, index)
+        if self.cached_gather is None or self.cached_index != cached_index:
+            gather = self.survey.get_gather(index)
+            if self.sort_by is not None:
+                gather = gather.sort(by=self.sort_by)
+            self.cached_index = cached_index
+            self.cached_gather = gather
+        gather = self.cached_gather
         gather.plot(ax=ax, **kwargs)
         self._plot_activated(gather[self.activated_coords_cols])
 
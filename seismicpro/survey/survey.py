@@ -1,8 +1,8 @@
 """Implements Survey class describing a single SEG-Y file"""
 
 import os
-import math
 import warnings
+import threading
 from textwrap import dedent
 from functools import partial
 from concurrent.futures import ThreadPoolExecutor
@@ -799,8 +799,15 @@ class Survey(GatherContainer, SamplesContainer):  # pylint: disable=too-many-ins
         var_buffer = np.empty(n_chunks, dtype=np.float64)
         chunk_weights = np.array(chunk_sizes, dtype=np.float64) / n_traces
 
+        # Each thread loads its chunks into a reusable buffer instead of allocating a new one for every chunk
+        n_samples = len(self.file_samples[self.loader.process_limits(limits)])
+        thread_buffers = threading.local()
+
         def collect_chunk_stats(i):
-            chunk = self.load_traces(chunk_traces_pos[i], limits=limits)
+            if not hasattr(thread_buffers, "buffer"):
+                thread_buffers.buffer = np.empty((chunk_sizes[0], n_samples), dtype=self.loader.dtype)
+            chunk_buffer = thread_buffers.buffer[:len(chunk_traces_pos[i])]
+            chunk = self.load_traces(chunk_traces_pos[i], limits=limits, buffer=chunk_buffer)
             chunk_quantile_mask = chunk_quantile_traces_mask[i]
             if chunk_quantile_mask.any():
                 quantile_traces_buffer[i] = chunk[chunk_quantile_mask].ravel()
@@ -872,7 +879,7 @@ class Survey(GatherContainer, SamplesContainer):  # pylint: disable=too-many-ins
         # return the same type as q: either single float or array-like
         return quantiles.item() if quantiles.ndim == 0 else quantiles
 
-    def mark_dead_traces(self, limits=None, bar=True):
+    def mark_dead_traces(self, limits=None, bar=True, chunk_size=1000):
         """Mark dead traces (those having constant amplitudes) by setting a value of a new `DeadTrace`
         header to `True` and store the overall number of dead traces in the `n_dead_traces` attribute.
 
@@ -883,6 +890,8 @@ class Survey(GatherContainer, SamplesContainer):  # pylint: disable=too-many-ins
             object. If not given, `limits` passed to `__init__` are used. Measured in samples.
         bar : bool, optional, defaults to True
             Whether to show a progress bar.
+        chunk_size : int, optional, defaults to 1000
+            The number of traces to load and check at once.
 
         Returns
         -------
@@ -892,16 +901,24 @@ class Survey(GatherContainer, SamplesContainer):  # pylint: disable=too-many-ins
         traces_pos = self["TRACE_SEQUENCE_FILE"] - 1
         limits = self.loader.process_limits(get_first_defined(limits, self.limits))
         n_samples = len(self.file_samples[limits])
+        n_traces = len(traces_pos)
 
-        buffer = np.empty((1, n_samples), dtype=self.loader.dtype)
+        buffer = np.empty((min(chunk_size, n_traces), n_samples), dtype=self.loader.dtype)
         dead_indices = []
-        for tr_index, pos in tqdm(enumerate(traces_pos), desc=f"Detecting dead traces for survey {self.name}",
-                                  total=len(self.headers), disable=not bar):
-            trace = self.load_traces([pos], limits=limits, buffer=buffer).ravel()
-            trace_min, trace_max, *_ = calculate_trace_stats(trace)
-
-            if math.isclose(trace_min, trace_max):
-                dead_indices.append(tr_index)
+        with tqdm(total=n_traces, desc=f"Detecting dead traces for survey {self.name}", disable=not bar) as pbar:
+            for start in range(0, n_traces, chunk_size):
+                chunk_pos = traces_pos[start : start + chunk_size]
+                traces = self.load_traces(chunk_pos, limits=limits, buffer=buffer[:len(chunk_pos)])
+                # Ignore nan values without emitting warnings for traces consisting only of them
+                trace_mins = np.fmin.reduce(traces, axis=1).astype(np.float64)
+                trace_maxs = np.fmax.reduce(traces, axis=1).astype(np.float64)
+
+                # Vectorized equivalent of math.isclose with its default relative tolerance
+                tol = 1e-9 * np.maximum(np.abs(trace_mins), np.abs(trace_maxs))
+                is_dead = np.abs(trace_maxs - trace_mins) <= tol
+                dead_indices.append(start + np.flatnonzero(is_dead))
+                pbar.update(len(chunk_pos))
+        dead_indices = np.concatenate(dead_indices) if dead_indices else np.array([], dtype=np.int64)
 
         self.n_dead_traces = len(dead_indices)
         self.headers[HDR_DEAD_TRACE] = False
@@ -1125,7 +1142,7 @@ class Survey(GatherContainer, SamplesContainer):  # pylint: disable=too-many-ins
         self.samples = self.file_samples[self.limits]
         self.sample_interval = self.file_sample_interval * self.limits.step
 
-    def remove_dead_traces(self, limits=None, inplace=False, bar=True):
+    def remove_dead_traces(self, limits=None, inplace=False, bar=True, chunk_size=1000):
         """ Remove dead (constant) traces from the survey.
         Calls `mark_dead_traces` if it was not called before.
 
@@ -1138,6 +1155,8 @@ class Survey(GatherContainer, SamplesContainer):  # pylint: disable=too-many-ins
             Whether to remove traces inplace or return a new survey instance.
         bar : bool, optional, defaults to True
             Whether to show a progress bar.
+        chunk_size : int, optional, defaults to 1000
+            The number of traces to load and check at once if dead traces are detected.
 
         Returns
         -------
@@ -1146,7 +1165,7 @@ class Survey(GatherContainer, SamplesContainer):  # pylint: disable=too-many-ins
         """
         self = maybe_copy(self, inplace)  # pylint: disable=self-cls-assignment
         if not self.dead_traces_marked:
-            self.mark_dead_traces(limits=limits, bar=bar)
+            self.mark_dead_traces(limits=limits, bar=bar, chunk_size=chunk_size)
 
         self.filter(lambda dt: ~dt, cols=HDR_DEAD_TRACE, inplace=True)
         self.n_dead_traces = 0
@@ -4,7 +4,7 @@ import numpy as np
 from numba import njit, prange
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def calculate_trace_stats(trace):
     """Calculate min, max, mean and var of trace amplitudes."""
     trace_min = np.float32(np.inf)
@@ -171,3 +171,40 @@ class TestDeadTraces:
         survey_copy.n_dead_traces = np.sum(is_dead)
 
         assert_surveys_equal(survey, survey_copy)
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 5, 7, 100])
+    def test_mark_chunked(self, stat_segy, header_index, chunk_size):
+        """Check that `mark_dead_traces` does not depend on `chunk_size`, including the cases when the number of traces
+        is not divisible by it and dead traces are located at chunk borders."""
+        path, trace_data = stat_segy
+        survey = Survey(path, header_index=header_index, header_cols="offset")
+
+        traces_pos = survey.headers.reset_index()["TRACE_SEQUENCE_FILE"].values - 1
+        trace_data = trace_data[np.argsort(traces_pos)]
+
+        survey_copy = survey.copy()
+
+        survey.mark_dead_traces(chunk_size=chunk_size, bar=False)
+
+        is_dead = np.isclose(trace_data.min(axis=1), trace_data.max(axis=1))
+        survey_copy.headers[HDR_DEAD_TRACE] = is_dead
+        survey_copy.n_dead_traces = np.sum(is_dead)
+
+        assert_surveys_equal(survey, survey_copy)
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 100])
+    def test_remove_chunked(self, stat_segy, header_index, chunk_size):
+        """Check that `remove_dead_traces` passes `chunk_size` to `mark_dead_traces` and does not depend on it."""
+        path, _ = stat_segy
+        survey = Survey(path, header_index=header_index, header_cols="offset")
+        survey_filtered = survey.remove_dead_traces(bar=False, chunk_size=chunk_size)
+        assert_surveys_equal(survey_filtered, survey.remove_dead_traces(bar=False))
+
+    def test_mark_positional_args(self, stat_segy, header_index):
+        """Check that `limits` and `bar` can still be passed to `mark_dead_traces` positionally."""
+        path, _ = stat_segy
+        survey = Survey(path, header_index=header_index, header_cols="offset")
+        survey_copy = survey.copy()
+        survey.mark_dead_traces(slice(2, 8), False)
+        survey_copy.mark_dead_traces(limits=slice(2, 8), bar=False)
+        assert_surveys_equal(survey, survey_copy)
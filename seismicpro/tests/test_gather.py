@@ -9,6 +9,11 @@ import numpy as np
 from seismicpro import Survey, Muter, StackingVelocity
 from seismicpro.utils import to_list
 from seismicpro.const import HDR_FIRST_BREAK
+from seismicpro.gather.utils import correction
+from seismicpro.velocity_spectrum import VerticalVelocitySpectrum
+from seismicpro.velocity_spectrum.velocity_spectrum import COHERENCY_FUNCS
+
+from .conftest import N_SAMPLES
 
 
 # Constants
@@ -267,6 +272,36 @@ def test_gather_res_velocity_spectrum(gather):
     stacking_velocity = StackingVelocity(times=[0, 3000], velocities=[1600, 3500])
     gather.calculate_residual_velocity_spectrum(stacking_velocity=stacking_velocity)
 
+@pytest.mark.parametrize('mode', ('S', 'NS', 'NE', 'CC', 'ENCC'))
+@pytest.mark.parametrize('t_min_ix, t_max_ix', [(0, 10), (100, 300), (N_SAMPLES - 20, N_SAMPLES), (0, N_SAMPLES)])
+def test_calc_single_velocity_spectrum(gather, mode, t_min_ix, t_max_ix):
+    """Compare `calc_single_velocity_spectrum` with a reference implementation which applies NMO to the time window
+    and pads the corrected gather with nans up to the length of the original traces."""
+    gather.sort(by='offset')
+    coherency_func = COHERENCY_FUNCS[mode]
+    half_win_size_samples = 12
+    velocity = 2.5  # m/ms
+    spectrum = VerticalVelocitySpectrum.calc_single_velocity_spectrum(
+        coherency_func=coherency_func, gather_data=gather.data, times=gather.times, offsets=gather.offsets,
+        velocity=velocity, sample_interval=gather.sample_interval, half_win_size_samples=half_win_size_samples,
+        t_min_ix=t_min_ix, t_max_ix=t_max_ix
+    )
+
+    t_win_size_min_ix = max(0, t_min_ix - half_win_size_samples)
+    t_win_size_max_ix = min(N_SAMPLES - 1, t_max_ix + half_win_size_samples)
+    win_times = gather.times[t_win_size_min_ix : t_win_size_max_ix + 1]
+    corrected_data = np.full_like(gather.data, np.nan)
+    corrected_data[:, :len(win_times)] = correction.apply_nmo(gather.data, win_times, gather.offsets, velocity,
+                                                              gather.sample_interval, False, np.inf, np.nan)
+    numerator, denominator = coherency_func(corrected_data)
+    expected_spectrum = []
+    for t in range(t_min_ix, t_max_ix):
+        t_rel = t - t_win_size_min_ix
+        ix_from = max(0, t_rel - half_win_size_samples)
+        ix_to = min(N_SAMPLES - 1, t_rel + half_win_size_samples)
+        expected_spectrum.append(np.sum(numerator[ix_from : ix_to]) / (np.sum(denominator[ix_from : ix_to]) + 1e-8))
+    assert np.allclose(spectrum, expected_spectrum, rtol=1e-5, atol=1e-6 * np.abs(expected_spectrum).max())
+
 def test_gather_stacking_velocity(gather):
     """test_gather_stacking_velocity"""
     gather.sort(by='offset')
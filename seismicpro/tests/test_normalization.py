@@ -0,0 +1,81 @@
+"""Test tracewise statistics used for gather normalization"""
+
+import sys
+import subprocess
+
+import pytest
+import numpy as np
+
+from seismicpro.gather.utils import normalization
+
+
+def make_data(n_traces=20, trace_len=50, nan_traces=(), partial_nan_traces=(), dtype=np.float32):
+    """Generate random data with given traces consisting only of nans and given traces partially filled with nans."""
+    rng = np.random.default_rng(42)
+    data = rng.normal(loc=10, scale=5, size=(n_traces, trace_len)).astype(dtype)
+    for i in partial_nan_traces:
+        data[i, rng.choice(trace_len, size=trace_len // 2, replace=False)] = np.nan
+        data[i, 0] = np.nan  # Check that leading nans are skipped
+    data[list(nan_traces)] = np.nan
+    return data
+
+
+DATA_PARAMS = [
+    {},  # no nans
+    {"partial_nan_traces": [0, 5, 19]},  # some nans in a trace including the first and last ones
+    {"nan_traces": [3], "partial_nan_traces": [0, 7]},  # both a nan trace and traces with some nans
+    {"nan_traces": [0, 19]},  # nan traces only, including the first and last ones
+    {"n_traces": 1, "trace_len": 1},  # a single sample
+    {"n_traces": 3, "nan_traces": [0, 1, 2]},  # all traces are nan
+    {"dtype": np.float64, "partial_nan_traces": [1]},
+]
+
+
+@pytest.mark.parametrize("params", DATA_PARAMS)
+def test_get_tracewise_nan_stats(params):
+    """Compare `get_tracewise_nan_stats` with `np.nanmean` and `np.nanvar`."""
+    data = make_data(**params)
+    counts, means, variances = normalization.get_tracewise_nan_stats(data)
+    with np.testing.suppress_warnings() as sup:
+        sup.filter(RuntimeWarning)
+        expected_means = np.nanmean(data.astype(np.float64), axis=1)
+        expected_variances = np.nanvar(data.astype(np.float64), axis=1)
+    np.testing.assert_array_equal(counts, (~np.isnan(data)).sum(axis=1))
+    np.testing.assert_allclose(means, expected_means)
+    np.testing.assert_allclose(variances, expected_variances, atol=1e-10)
+
+
+@pytest.mark.parametrize("params", DATA_PARAMS)
+def test_merge_nan_stats(params):
+    """Compare mean and variance obtained by `merge_nan_stats` with `np.nanmean` and `np.nanvar` of the whole data."""
+    data = make_data(**params)
+    mean, var = normalization.merge_nan_stats(*normalization.get_tracewise_nan_stats(data))
+    if np.isnan(data).all():
+        assert np.isnan(mean) and np.isnan(var)
+    else:
+        np.testing.assert_allclose(mean, np.nanmean(data.astype(np.float64)))
+        np.testing.assert_allclose(var, np.nanvar(data.astype(np.float64)), atol=1e-10)
+
+
+THREADED_CALLS = """
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from seismicpro.gather.utils import normalization
+
+def process(seed):
+    data = np.random.default_rng(seed).normal(size=(100, 500)).astype(np.float32)
+    data[0] = np.nan
+    mean, var = normalization.merge_nan_stats(*normalization.get_tracewise_nan_stats(data))
+    data = normalization.scale_standard(data, np.float32(mean), np.float32(np.sqrt(var)), np.float32(1e-10))
+    return normalization.clip_inplace(data, np.float32(-1), np.float32(1))
+
+with ThreadPoolExecutor(8) as pool:
+    list(pool.map(process, range(32)))
+"""
+
+
+def test_threaded_calls():
+    """Check that statistics are calculated without hanging when called from several threads, as done by batch
+    actions with `target="threads"`. A separate process is used so that a hang fails the test instead of blocking the
+    test session."""
+    subprocess.run([sys.executable, "-c", THREADED_CALLS], check=True, timeout=300)
@@ -0,0 +1,38 @@
+"""Test plotting of stacking velocity quality control metrics"""
+
+# pylint: disable=redefined-outer-name
+import pytest
+import numpy as np
+import matplotlib.pyplot as plt
+
+from seismicpro import StackingVelocity, StackingVelocityField
+from seismicpro.utils import Coordinates
+from seismicpro.stacking_velocity.metrics import VELOCITY_QC_METRICS
+
+
+@pytest.fixture(scope="module")
+def metric_maps():
+    """Calculate all default quality control metrics for a field of stacking velocities defined on a 3x3 grid."""
+    stacking_velocities = [
+        StackingVelocity(times=[0, 1000, 2000], velocities=[1500 + 10 * i, 2500 + 20 * i, 3500],
+                         coords=Coordinates((i % 3 * 10, i // 3 * 10), names=("INLINE_3D", "CROSSLINE_3D")))
+        for i in range(9)
+    ]
+    field = StackingVelocityField(stacking_velocities)
+    return field.qc(radius=15, times=np.arange(0, 2000, 100), n_workers=1, bar=False)
+
+
+@pytest.mark.parametrize("metric_ix", range(len(VELOCITY_QC_METRICS)))
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"lw": 2, "alpha": 0.5},  # supported both by lines and line collections
+    {"marker": "o", "markersize": 3},  # supported only by lines
+])
+def test_plot_on_click(metric_maps, metric_ix, kwargs):
+    """Check that stacking velocities in a window are plotted with any kwargs accepted by `ax.plot`."""
+    metric_map = metric_maps[metric_ix]
+    metric = metric_map.metric.bind_metric_map(metric_map)
+    fig, ax = plt.subplots()
+    metric.plot_on_click(ax=ax, coords=(10, 10), index=(10, 10), **kwargs)
+    assert ax.lines or ax.collections
+    plt.close(fig)
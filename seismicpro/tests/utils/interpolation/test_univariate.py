@@ -4,7 +4,8 @@ import pytest
 import numpy as np
 from scipy.interpolate import interp1d as sp_interp1d
 
-from seismicpro.utils import interp1d
+from seismicpro.utils import interp1d, times_to_indices
+from seismicpro.utils.interpolation.univariate import interpolate
 
 
 @pytest.mark.parametrize("func, coords, eval_coords", [
@@ -20,3 +21,42 @@ def test_interp1d(func, coords, eval_coords):
     interp = interp1d(coords, values)
     sp_interp = sp_interp1d(coords, values, fill_value="extrapolate")
     assert np.allclose(interp(eval_coords), sp_interp(eval_coords))
+
+
+def times_to_indices_by_interpolation(times, samples, round):
+    """Convert `times` to indices in `samples` by general linear interpolation which is used for irregular samples."""
+    left_slope = 1 / (samples[1] - samples[0])
+    right_slope = 1 / (samples[-1] - samples[-2])
+    indices = interpolate(times, samples, np.arange(len(samples), dtype=np.float32), left_slope, right_slope)
+    return np.rint(indices) if round else indices
+
+
+@pytest.mark.parametrize("samples", [
+    np.arange(1000, dtype=np.float32) * 2,  # regular samples
+    np.arange(1000, dtype=np.float32) * 3 + 100,  # regular samples with a non-zero start and a non-dyadic interval
+    np.arange(1000, dtype=np.float64) * 0.25,  # regular samples of float64 dtype
+    np.arange(1000, dtype=np.float32) * 0.1,  # samples are irregular due to float32 rounding errors
+    np.cumsum(np.random.default_rng(42).uniform(1, 5, size=1000)),  # irregular samples
+])
+@pytest.mark.parametrize("round", [False, True])
+def test_times_to_indices(samples, round):
+    """Check that `times_to_indices` matches general linear interpolation for both regular and irregular samples,
+    including times outside the samples range and times halfway between adjacent samples."""
+    left_ext = samples[0] - (samples[1] - samples[0]) * np.arange(1, 10)
+    right_ext = samples[-1] + (samples[-1] - samples[-2]) * np.arange(1, 10)
+    times = np.concatenate([
+        samples,  # times exactly equal to samples
+        (samples[:-1] + samples[1:]) / 2,  # .5 boundaries of indices
+        np.concatenate([left_ext, right_ext]),  # times outside the samples range
+        (left_ext[:-1] + left_ext[1:]) / 2,  # .5 boundaries outside the samples range
+        np.random.default_rng(42).uniform(samples[0] - 100, samples[-1] + 100, size=1000),
+    ]).astype(np.float64)
+
+    indices = times_to_indices(times, samples, round=round)
+    expected_indices = times_to_indices_by_interpolation(times, samples, round=round)
+    if round:
+        np.testing.assert_array_equal(indices, expected_indices)
+    else:
+        np.testing.assert_allclose(indices, expected_indices, rtol=0, atol=1e-9)
+    np.testing.assert_array_equal(times_to_indices(samples.astype(np.float64), samples, round=round),
+                                  np.arange(len(samples)))
@@ -4,7 +4,7 @@ import numpy as np
 from numba import njit, prange
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def interpolate(x_new, x, y, left_slope, right_slope):
     """Return a 1d piecewise linear interpolant to a function defined by pairs of data points `(x, y)`, evaluated at
     `x_new`. Function values at points outside the `x` range will be linearly extrapolated using passed slopes."""
@@ -62,7 +62,7 @@ class interp1d:
         return res.item() if is_scalar_input else res
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def times_to_indices(times, samples, round=False):
     """Convert `times` to their indices in the increasing `samples` array. If some value of `times` is not present
     in `samples`, its index is linearly interpolated or extrapolated by the other indices of `samples`.
@@ -93,15 +93,31 @@ def times_to_indices(times, samples, round=False):
     return _times_to_indices(times=times, samples=samples, round=round)
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def _times_to_indices(times, samples, round):
-    left_slope = 1 / (samples[1] - samples[0])
-    right_slope = 1 / (samples[-1] - samples[-2])
-    float_position = interpolate(times, samples, np.arange(len(samples), dtype=np.float32), left_slope, right_slope)
+    sample_interval = samples[1] - samples[0]
+    is_uniform = True
+    for i in range(1, len(samples) - 1):
+        if samples[i + 1] - samples[i] != sample_interval:
+            is_uniform = False
+            break
+
+    if is_uniform:
+        # Indices of regularly sampled times are obtained by a linear transform without searching in samples
+        start = np.float64(samples[0])
+        inv_sample_interval = 1 / np.float64(sample_interval)
+        float_position = np.empty(len(times), dtype=np.float64)
+        for i, time in enumerate(times):
+            float_position[i] = (time - start) * inv_sample_interval
+    else:
+        left_slope = 1 / sample_interval
+        right_slope = 1 / (samples[-1] - samples[-2])
+        float_position = interpolate(times, samples, np.arange(len(samples), dtype=np.float32), left_slope,
+                                     right_slope)
     return np.rint(float_position) if round else float_position
 
 
-@njit(nogil=True)
+@njit(nogil=True, parallel=True, cache=True)
 def calculate_basis_polynomials(x_new, x, n):
     """ Calculate the values of basis polynomials for Lagrange interpolation. """
 
@@ -118,31 +134,32 @@ def calculate_basis_polynomials(x_new, x, n):
     else:
         leftmost_indices = np.ceil(_times_to_indices(x_new , x, False)) - N // 2
 
-    indices = leftmost_indices.reshape(-1, 1) + np.arange(N)
-    sign = np.sign(indices + 1e-3)
-
-    # Reflect indices from array borders
-    div, mod = np.divmod(np.abs(indices), len(x) - 1)
-    indices = np.where(div % 2, np.abs(len(x) - mod - 1), mod).astype(np.int32)
-
-    times = np.empty_like(indices, dtype=np.float32)
-    for i, ind in enumerate(indices):
-        times[i] = x[ind]
-
-    # Reflect times accordingly
-    times = np.where(div % 2, x.max() - times,  times)
-    times = (times + x.max() * div) * sign
+    # Basis polynomials for each new point are independent, so they are calculated in parallel
+    x_max = x.max()
+    indices = np.empty((len(x_new), N), dtype=np.int32)
+    times = np.empty((len(x_new), N), dtype=np.float64)
+    for i in prange(len(x_new)):  # pylint: disable=not-an-iterable
+        # Reflect indices from array borders and get the corresponding times accordingly
+        for k in range(N):
+            ix = leftmost_indices[i] + k
+            sign = np.sign(ix + 1e-3)
+            div, mod = divmod(abs(ix), len(x) - 1)
+            is_reflected = div % 2 != 0
+            indices[i, k] = abs(len(x) - mod - 1) if is_reflected else mod
+            time = np.float32(x[indices[i, k]])
+            if is_reflected:
+                time = x_max - time
+            times[i, k] = (time + x_max * div) * sign
 
-    for i, (time, it) in enumerate(zip(times, x_new)):
         for k in range(N):
             for j in range(N):
                 if k != j:
-                    polynomials[i, k] *= (it - time[j]) / (time[k] - time[j])
+                    polynomials[i, k] *= (x_new[i] - times[i, j]) / (times[i, k] - times[i, j])
 
     return polynomials, indices
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def piecewise_polynomial(x_new, x, y, n):
     """" Perform piecewise polynomial (with degree n) interpolation . Note, x is expected to be sorted. """
     is_1d = y.ndim == 1
@@ -29,6 +29,7 @@ class VelocitySpectrumPlot(PairedPlot):  # pylint: disable=too-many-instance-att
         self.title = title
         self.click_time = None
         self.click_vel = None
+        self.corrected_gather = None
         self.velocity_spectrum = velocity_spectrum
         self.gather = self.velocity_spectrum.gather.copy(ignore="data").sort('offset')
         self.plot_velocity_spectrum = partial(self.velocity_spectrum._plot, title=None, **kwargs)
@@ -60,9 +61,12 @@ class VelocitySpectrumPlot(PairedPlot):  # pylint: disable=too-many-instance-att
         """Get an optionally corrected gather."""
         if not corrected:
             return self.gather
-        max_stretch_factor = self.velocity_spectrum.max_stretch_factor
-        return self.gather.copy(ignore=["headers", "data", "samples"]) \
-                          .apply_nmo(self.click_vel * 1000, max_stretch_factor=max_stretch_factor)
+        # Reuse the corrected gather until the next click since switching views triggers a redraw
+        if self.corrected_gather is None:
+            max_stretch_factor = self.velocity_spectrum.max_stretch_factor
+            self.corrected_gather = self.gather.copy(ignore=["headers", "data", "samples"]) \
+                                               .apply_nmo(self.click_vel * 1000, max_stretch_factor=max_stretch_factor)
+        return self.corrected_gather
 
     def get_hodograph(self, corrected):
         """Get hodograph times if click has been performed."""
@@ -94,6 +98,7 @@ class VelocitySpectrumPlot(PairedPlot):  # pylint: disable=too-many-instance-att
         self.aux.view_button.disabled = False
         self.click_time = click_time
         self.click_vel = click_vel
+        self.corrected_gather = None
         self.aux.redraw()
         return coords
 
@@ -101,5 +106,6 @@ class VelocitySpectrumPlot(PairedPlot):  # pylint: disable=too-many-instance-att
         """Remove the highlighted hodograph and switch to a non-corrected view."""
         self.click_time = None
         self.click_vel = None
+        self.corrected_gather = None
         self.aux.set_view(0)
         self.aux.view_button.disabled = True
@@ -2,18 +2,37 @@
 
 # pylint: disable=not-an-iterable, missing-function-docstring
 import numpy as np
-from numba import prange, jit_module
+from numba import njit, prange, jit_module
+
+from ...const import ALL_FASTMATH_FLAGS
+
+
+@njit(nogil=True)
+def _get_column_stats(corrected_gather, i):
+    # Fused single pass over a column: count of non-nan values, their sum, sum of squares and sum of absolute values
+    n = 0
+    amp_sum = 0.0
+    amp_sq_sum = 0.0
+    amp_abs_sum = 0.0
+    for j in range(corrected_gather.shape[0]):
+        amp = corrected_gather[j, i]
+        if not np.isnan(amp):
+            n += 1
+            amp_sum += amp
+            amp_sq_sum += amp ** 2
+            amp_abs_sum += abs(amp)
+    return n, amp_sum, amp_sq_sum, amp_abs_sum
 
 
 def stacked_amplitude(corrected_gather, amplify_factor=0, abs=True):
     numerator = np.empty_like(corrected_gather[0])
     denominator = np.ones_like(corrected_gather[0])
     for i in prange(corrected_gather.shape[1]):
-        numerator[i] = np.nansum(corrected_gather[:, i])
+        n, amp_sum, _, _ = _get_column_stats(corrected_gather, i)
         if abs:
-            numerator[i] = np.abs(numerator[i])
-        n = max(np.sum(~np.isnan(corrected_gather[:, i])), np.int64(1))
-        numerator[i] = numerator[i] * ((amplify_factor / np.sqrt(n)) + ((1 - amplify_factor) / n))
+            amp_sum = np.abs(amp_sum)
+        n = max(n, 1)
+        numerator[i] = amp_sum * ((amplify_factor / np.sqrt(n)) + ((1 - amplify_factor) / n))
     return numerator, denominator
 
 
@@ -21,8 +40,9 @@ def normalized_stacked_amplitude(corrected_gather):
     numerator = np.empty_like(corrected_gather[0])
     denominator = np.empty_like(corrected_gather[0])
     for i in prange(corrected_gather.shape[1]):
-        numerator[i] = np.abs(np.nansum(corrected_gather[:, i]))
-        denominator[i] = np.nansum(np.abs(corrected_gather[:, i]))
+        _, amp_sum, _, amp_abs_sum = _get_column_stats(corrected_gather, i)
+        numerator[i] = np.abs(amp_sum)
+        denominator[i] = amp_abs_sum
     return numerator, denominator
 
 
@@ -30,8 +50,9 @@ def semblance(corrected_gather):
     numerator = np.empty_like(corrected_gather[0])
     denominator = np.empty_like(corrected_gather[0])
     for i in prange(corrected_gather.shape[1]):
-        numerator[i] = (np.nansum(corrected_gather[:, i]) ** 2) / max(np.sum(~np.isnan(corrected_gather[:, i])), 1)
-        denominator[i] = np.nansum(corrected_gather[:, i] ** 2)
+        n, amp_sum, amp_sq_sum, _ = _get_column_stats(corrected_gather, i)
+        numerator[i] = (amp_sum ** 2) / max(n, 1)
+        denominator[i] = amp_sq_sum
     return numerator, denominator
 
 
@@ -39,7 +60,8 @@ def crosscorrelation(corrected_gather):
     numerator = np.empty_like(corrected_gather[0])
     denominator = np.ones_like(corrected_gather[0])
     for i in prange(corrected_gather.shape[1]):
-        numerator[i] = ((np.nansum(corrected_gather[:, i]) ** 2) - np.nansum(corrected_gather[:, i] ** 2)) / 2
+        _, amp_sum, amp_sq_sum, _ = _get_column_stats(corrected_gather, i)
+        numerator[i] = ((amp_sum ** 2) - amp_sq_sum) / 2
     return numerator, denominator
 
 
@@ -47,12 +69,11 @@ def energy_normalized_crosscorrelation(corrected_gather):
     numerator = np.empty_like(corrected_gather[0])
     denominator = np.empty_like(corrected_gather[0])
     for i in prange(corrected_gather.shape[1]):
-        input_enerty =  np.nansum(corrected_gather[:, i] ** 2)
-        output_energy = np.nansum(corrected_gather[:, i]) ** 2
-        numerator[i] = (output_energy - input_enerty) / max(np.sum(~np.isnan(corrected_gather[:, i])) - 1, 1)
+        n, amp_sum, input_enerty, _ = _get_column_stats(corrected_gather, i)
+        output_energy = amp_sum ** 2
+        numerator[i] = (output_energy - input_enerty) / max(n - 1, 1)
         denominator[i] = input_enerty
     return numerator, denominator
 
 
-ALL_FASTMATH_FLAGS  = {'nnan', 'ninf', 'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
 jit_module(nopython=True, nogil=True, parallel=True, fastmath=ALL_FASTMATH_FLAGS - {'nnan'})
@@ -151,14 +151,33 @@ class BaseVelocitySpectrum:
                                                      max_stretch_factor=max_stretch_factor)
         numerator, denominator = coherency_func(corrected_gather_data)
 
+        # `apply_nmo` returns only the columns for the requested times, while windows are clipped by the length of the
+        # original traces as if the rest of the corrected gather was filled with nan. Coherency of such a column is
+        # calculated once and accounted for by the number of columns each window covers beyond the corrected data.
+        nan_column = np.full((gather_data.shape[0], 1), np.nan, dtype=gather_data.dtype)
+        nan_numerator, nan_denominator = coherency_func(nan_column)
+
         if out is None:
             out = np.empty(t_max_ix - t_min_ix, dtype=np.float32)
 
-        for t in prange(t_min_ix, t_max_ix):
+        # Calculate prefix sums of numerator and denominator so that each window sum is obtained in constant time
+        numerator_cumsum = np.zeros(len(numerator) + 1, dtype=np.float64)
+        denominator_cumsum = np.zeros(len(denominator) + 1, dtype=np.float64)
+        for i in range(len(numerator)):
+            numerator_cumsum[i + 1] = numerator_cumsum[i] + numerator[i]
+            denominator_cumsum[i + 1] = denominator_cumsum[i] + denominator[i]
+
+        # The function is called for each velocity from an outer prange, so the loop over times is kept serial
+        for t in range(t_min_ix, t_max_ix):
             t_rel = t - t_win_size_min_ix
             ix_from = max(0, t_rel - half_win_size_samples)
-            ix_to = min(corrected_gather_data.shape[1] - 1, t_rel + half_win_size_samples)
-            out[t - t_min_ix] = np.sum(numerator[ix_from : ix_to]) / (np.sum(denominator[ix_from : ix_to]) + 1e-8)
+            ix_to = min(gather_data.shape[1] - 1, t_rel + half_win_size_samples)
+            data_ix_to = min(ix_to, len(numerator))
+            n_nan_columns = ix_to - data_ix_to
+            numerator_sum = numerator_cumsum[data_ix_to] - numerator_cumsum[ix_from] + n_nan_columns * nan_numerator[0]
+            denominator_sum = (denominator_cumsum[data_ix_to] - denominator_cumsum[ix_from] +
+                               n_nan_columns * nan_denominator[0])
+            out[t - t_min_ix] = numerator_sum / (denominator_sum + 1e-8)
         return out
 
     def _plot(self, title=None, x_label=None, x_ticklabels=None, x_ticker=None, y_ticklabels=None, y_ticker=None,
@@ -637,11 +656,19 @@ class ResidualVelocitySpectrum(BaseVelocitySpectrum):
         """
         velocity_spectrum = np.zeros((gather_data.shape[1], len(velocities)), dtype=np.float32)
         for i in prange(left_bound_ix.min(), right_bound_ix.max() + 1):
-            t_min_ix = np.where(right_bound_ix == i)[0]
-            t_min_ix = 0 if len(t_min_ix) == 0 else t_min_ix[0]
-
-            t_max_ix = np.where(left_bound_ix == i)[0]
-            t_max_ix = len(times) - 1 if len(t_max_ix) == 0 else t_max_ix[-1]
+            # Find the first time whose right bound and the last time whose left bound match the current velocity
+            # with a single scan each instead of building boolean masks and index arrays
+            t_min_ix = 0
+            for j in range(len(right_bound_ix)):  # pylint: disable=consider-using-enumerate
+                if right_bound_ix[j] == i:
+                    t_min_ix = j
+                    break
+
+            t_max_ix = len(times) - 1
+            for j in range(len(left_bound_ix) - 1, -1, -1):
+                if left_bound_ix[j] == i:
+                    t_max_ix = j
+                    break
 
             spectrum_func(coherency_func=coherency_func, gather_data=gather_data, times=times, offsets=offsets,
                           velocity=velocities[i], sample_interval=sample_interval,